@@ -2,13 +2,22 @@ import textwrap
 
 from test_builder import TestCase
 
+# Shared fragments of the `docker run` command used to start the agent with
+# container_collect_all in the Docker test cases below.
+DOCKER_AGENT_RUN = """docker run -d -e DD_API_KEY=xxxxxxxxxxxxxx \\
+     -e DD_LOGS_ENABLED=true \\
+     -e DD_LOGS_CONFIG_CONTAINER_COLLECT_ALL=true"""
+
+DOCKER_AGENT_MOUNTS = """     -v /var/run/docker.sock:/var/run/docker.sock:ro \\
+     -v /proc/:/host/proc/:ro \\
+     -v /opt/datadog-agent/run:/opt/datadog-agent/run:rw \\
+     -v /sys/fs/cgroup/:/host/sys/fs/cgroup:ro"""
+
 
 class ContainerTailJounald(TestCase):
     name = "[Journald] Agent collect docker logs through journald"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = """ # Setup
 Mount /etc/machine-id and use the following configuration
 
 Create a `conf.yaml` at `$(pwd)/journald.d`
@@ -36,23 +45,18 @@ docker run -d --name agent -e DD_API_KEY=... \\
 - in another shell, `docker run --log-driver=journald --rm alpine:latest echo "hello world"`
 - Search the logs stream for the message. Make sure the source and service tags are set correctly (should be the short image name)
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class ContainerCollectAll(TestCase):
     name = "[Docker] Test Container Collect All"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = f""" # Setup
 ```
-docker run -d -e DD_API_KEY=xxxxxxxxxxxxxx \\
-     -e DD_LOGS_ENABLED=true \\
-     -e DD_LOGS_CONFIG_CONTAINER_COLLECT_ALL=true \\
-     -v /var/run/docker.sock:/var/run/docker.sock:ro \\
-     -v /proc/:/host/proc/:ro \\
-     -v /opt/datadog-agent/run:/opt/datadog-agent/run:rw \\
-     -v /sys/fs/cgroup/:/host/sys/fs/cgroup:ro \\
+{DOCKER_AGENT_RUN} \\
+{DOCKER_AGENT_MOUNTS} \\
      datadog/agent:<AGENT_IMAGE>
 ```
 
@@ -70,15 +74,15 @@ docker run -d -e DD_API_KEY=xxxxxxxxxxxxxx \\
 - `DD_LOGS_CONFIG_DOCKER_CONTAINER_USE_FILE=false` uses docker socket to collect logs
 
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class AgentUsesAdLabels(TestCase):
     name = "[Docker] Agent uses AD in container labels"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = """ # Setup
 Run a container with an AD label:
 
 ```
@@ -95,15 +99,15 @@ chentex/random-logger:<AGENT_IMAGE>
 - Check that processing rules are working in AD labels:  `com.datadoghq.ad.logs: '[{"source": "java", "service": "myapp", "log_processing_rules": [{"type": "multi_line", "name": "log_start_with_date", "pattern" : "\\d{4}\\-(0?[1-9]|1[012])\\-(0?[1-9]|[12][0-9]|3[01])"}]}]'``
 - `DD_LOGS_CONFIG_DOCKER_CONTAINER_USE_FILE=false` uses docker socket to collect logs
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class DockerMaxFile(TestCase):
     name = "[Docker] Agent collects logs with max-file=1"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = """ # Setup
 Run the agent locally on your computer with
 
 ```
@@ -135,15 +139,15 @@ docker run --log-driver json-file -d centos bash -c "echo '1'; echo '2'; sleep 9
 - Check that after 2 minutes, you only see "1" and "2" in the log explorer
 
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class DockerFileTailingAD(TestCase):
     name = "[Docker] File from volume tailing with AD / container label"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = """ # Setup
 With the docker listener & provider activated start a container with a file log config.
 
 Run the Agent on a host while you use a container to generate log, in a file shared between the host and the container using a volume.
@@ -168,26 +172,21 @@ $ docker run -d --rm -v /tmp/share:/tmp/share  -l com.datadoghq.ad.logs='[{"type
 - Log coming from a file tailed thanks to a container label should bear all the tags related to the container
 
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class DockerFileTail(TestCase):
     name = "[Docker] Tailing Docker container from file is supported"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = f""" # Setup
 ```
-docker run -d -e DD_API_KEY=xxxxxxxxxxxxxx \
--e DD_LOGS_ENABLED=true \
--e DD_LOGS_CONFIG_CONTAINER_COLLECT_ALL=true \
--e DD_EXTRA_LISTENERS=docker \
--v /var/run/docker.sock:/var/run/docker.sock:ro \
--v /proc/:/host/proc/:ro \
--v /opt/datadog-agent/run:/opt/datadog-agent/run:rw \
--v /sys/fs/cgroup/:/host/sys/fs/cgroup:ro \
--v /var/lib/docker/containers:/var/lib/docker/containers:ro \
-datadog/agent:<AGENT_IMAGE>
+{DOCKER_AGENT_RUN} \\
+     -e DD_EXTRA_LISTENERS=docker \\
+{DOCKER_AGENT_MOUNTS} \\
+     -v /var/lib/docker/containers:/var/lib/docker/containers:ro \\
+     datadog/agent:<AGENT_IMAGE>
 ```
 
 ---
@@ -199,15 +198,15 @@ datadog/agent:<AGENT_IMAGE>
 - Logs are properly tagged with container metadata
 
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class PodmanFileTail(TestCase):
     name = "[Podman] Tailing podman containers from file is supported"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = """ # Setup
 ```
 Run the containerized agent in podman to enable AD to identify podman.  Note that podman can be installed on a mac (brew install podman) or in a VM.  Install at least podman-3.2.1, which is what the first customer using this functionality began with.
 
@@ -251,15 +250,15 @@ dd7ad06a44e6  docker.io/library/bash:latest                            -c while
 - All logs are properly tagged with container metadata
 
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class PodmanSocketTail(TestCase):
     name = "[Podman] Tailing podman containers via API is supported"
 
-    def build(self, config):  # noqa: U100
-        self.append(
-            """ # Setup
+    BODY = """ # Setup
 
 Run the containerized agent in podman to enable AD to identify podman.  Note that podman can be installed on a mac (brew install podman) or in a VM.  Install at least podman-3.3.1, which is the first version known to support this functionality.
 
@@ -300,7 +299,9 @@ To check:
 - All logs from podman containers are collected from the docker socket (see `agent status` that will now show whether a container is tailed from the docker socket or it's log file) 
 - All logs are properly tagged with container metadata
 """
-        )
+
+    def build(self, config):  # noqa: U100
+        self.append(self.BODY)
 
 
 class ContainerScenario(TestCase):